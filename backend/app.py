@@ -1,113 +1,50 @@
 import os
-from flask import Flask, request, jsonify
-from flask_sqlalchemy import SQLAlchemy
-from flask_cors import CORS
-from flask_migrate import Migrate
-from flask_jwt_extended import (
-    JWTManager, create_access_token, jwt_required, get_jwt_identity
-)
-from werkzeug.security import generate_password_hash, check_password_hash
-from datetime import datetime, timedelta
 
-# ============================================================
-# ⚙️ CONFIGURATION DE L’APPLICATION
-# ============================================================
-
-app = Flask(__name__)
+from flask import Flask, jsonify
+from werkzeug.middleware.proxy_fix import ProxyFix
 
-app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY', 'votre_secret_super_securise')
-app.config['JWT_SECRET_KEY'] = os.environ.get('JWT_SECRET_KEY', 'votre_jwt_secret')
-app.config['JWT_ACCESS_TOKEN_EXPIRES'] = timedelta(days=7)
-app.config['SQLALCHEMY_DATABASE_URI'] = os.environ.get('DATABASE_URL', 'sqlite:///artgens.db')
-app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
-
-# Initialisation des extensions
-db = SQLAlchemy(app)
-migrate = Migrate(app, db)
-CORS(app, resources={r"/api/*": {"origins": "*"}})
-jwt = JWTManager(app)
+from commands import register_commands
+from config import Config
+from extensions import db, migrate, cors, jwt, limiter
+from models import Category, User
+from routes import register_blueprints
 
 
 # ============================================================
-# 👥 MODÈLES
+# 🏭 FABRIQUE D’APPLICATION
 # ============================================================
 
-class User(db.Model):
-    id = db.Column(db.Integer, primary_key=True)
-    username = db.Column(db.String(80), unique=True, nullable=False)
-    email = db.Column(db.String(120), unique=True, nullable=False)
-    password_hash = db.Column(db.String(128))
-    is_artist = db.Column(db.Boolean, default=False)
-    bio = db.Column(db.Text)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
-
-    artworks = db.relationship('Artwork', backref='artist', lazy=True)
-    likes = db.relationship('Like', backref='user', lazy=True)
-    comments = db.relationship('Comment', backref='user', lazy=True)
-    cart_items = db.relationship('Cart', backref='user', lazy=True)
-
-    def set_password(self, password):
-        self.password_hash = generate_password_hash(password)
-    
-    def check_password(self, password):
-        return check_password_hash(self.password_hash, password)
-
-
-class Category(db.Model):
-    id = db.Column(db.Integer, primary_key=True)
-    name = db.Column(db.String(50), unique=True, nullable=False)
-
-
-artwork_categories = db.Table(
-    'artwork_categories',
-    db.Column('artwork_id', db.Integer, db.ForeignKey('artwork.id'), primary_key=True),
-    db.Column('category_id', db.Integer, db.ForeignKey('category.id'), primary_key=True)
-)
-
+def create_app(config=Config):
+    """Construit l'application ; `config` est un objet de config ou un dict."""
+    app = Flask(__name__)
+    if isinstance(config, dict):
+        app.config.from_object(Config)
+        app.config.update(config)
+    else:
+        app.config.from_object(config)
 
-class Artwork(db.Model):
-    id = db.Column(db.Integer, primary_key=True)
-    title = db.Column(db.String(100), nullable=False)
-    description = db.Column(db.Text)
-    price = db.Column(db.Float, nullable=False)
-    image_url = db.Column(db.String(200))
-    is_sold = db.Column(db.Boolean, default=False)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    # Derrière le proxy Render, remote_addr serait celle du proxy pour tous
+    if app.config.get("PROXY_FIX_X_FOR"):
+        app.wsgi_app = ProxyFix(app.wsgi_app, x_for=app.config["PROXY_FIX_X_FOR"])
 
-    artist_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
-    categories = db.relationship('Category', secondary=artwork_categories, backref='artworks')
-    likes = db.relationship('Like', backref='artwork', lazy=True)
-    comments = db.relationship('Comment', backref='artwork', lazy=True)
-    in_carts = db.relationship('Cart', backref='artwork', lazy=True)
+    # Initialisation des extensions
+    db.init_app(app)
+    migrate.init_app(app, db)
+    cors.init_app(app, resources={r"/api/*": {"origins": "*"}})
+    jwt.init_app(app)
+    limiter.init_app(app)
 
-
-class Like(db.Model):
-    id = db.Column(db.Integer, primary_key=True)
-    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
-    artwork_id = db.Column(db.Integer, db.ForeignKey('artwork.id'), nullable=False)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
-
-
-class Comment(db.Model):
-    id = db.Column(db.Integer, primary_key=True)
-    content = db.Column(db.Text, nullable=False)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
-    artwork_id = db.Column(db.Integer, db.ForeignKey('artwork.id'), nullable=False)
-
-
-class Cart(db.Model):
-    id = db.Column(db.Integer, primary_key=True)
-    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
-    artwork_id = db.Column(db.Integer, db.ForeignKey('artwork.id'), nullable=False)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    register_blueprints(app)
+    register_commands(app)
+    app.add_url_rule('/', 'home', home)
+    return app
 
 
 # ============================================================
 # 🧱 INITIALISATION DE LA BASE
 # ============================================================
 
-def init_db():
+def init_db(app):
     with app.app_context():
         db.create_all()
         seed_categories()
@@ -143,279 +80,10 @@ def seed_demo_user():
         print("✅ Utilisateur démo ajouté.")
 
 
-# ============================================================
-# 🔐 AUTHENTIFICATION
-# ============================================================
-
-@app.route("/api/register", methods=["POST"])
-def register():
-    data = request.get_json()
-    if not data or "email" not in data or "password" not in data:
-        return jsonify({"error": "Champs requis manquants"}), 400
-
-    if User.query.filter_by(email=data["email"]).first():
-        return jsonify({"error": "Email déjà utilisé"}), 400
-
-    user = User(
-        username=data.get("username", data["email"].split("@")[0]),
-        email=data["email"],
-        is_artist=data.get("is_artist", False),
-        bio=data.get("bio", "")
-    )
-    user.set_password(data["password"])
-    db.session.add(user)
-    db.session.commit()
-
-    token = create_access_token(identity=user.id)
-    return jsonify({
-        "token": token,
-        "user": {
-            "id": user.id, "username": user.username,
-            "email": user.email, "is_artist": user.is_artist, "bio": user.bio
-        }
-    }), 201
-
-
-@app.route("/api/login", methods=["POST"])
-def login():
-    data = request.get_json()
-    if not data or "email" not in data or "password" not in data:
-        return jsonify({"error": "Champs requis manquants"}), 400
-
-    user = User.query.filter_by(email=data["email"]).first()
-    if user and user.check_password(data["password"]):
-        token = create_access_token(identity=user.id)
-        return jsonify({
-            "token": token,
-            "user": {
-                "id": user.id, "username": user.username,
-                "email": user.email, "is_artist": user.is_artist, "bio": user.bio
-            }
-        }), 200
-
-    return jsonify({"error": "Email ou mot de passe incorrect"}), 401
-
-
-@app.route("/api/me", methods=["GET"])
-@jwt_required()
-def get_current_user():
-    user_id = get_jwt_identity()
-    user = User.query.get(user_id)
-    if not user:
-        return jsonify({"error": "Utilisateur non trouvé"}), 404
-    return jsonify({
-        "id": user.id, "username": user.username,
-        "email": user.email, "is_artist": user.is_artist, "bio": user.bio
-    }), 200
-
-
-# ============================================================
-# 🎨 GESTION DES ŒUVRES
-# ============================================================
-
-@app.route("/api/artworks", methods=["GET"])
-def get_artworks():
-    artworks = Artwork.query.order_by(Artwork.created_at.desc()).all()
-    return jsonify([{
-        "id": a.id,
-        "title": a.title,
-        "description": a.description,
-        "price": a.price,
-        "image_url": a.image_url,
-        "artist_id": a.artist_id,
-        "artist_name": a.artist.username if a.artist else None,
-        "likes_count": len(a.likes),
-        "is_sold": a.is_sold,
-        "created_at": a.created_at.isoformat()
-    } for a in artworks]), 200
-
-
-@app.route("/api/artworks", methods=["POST"])
-@jwt_required()
-def create_artwork():
-    user_id = get_jwt_identity()
-    user = User.query.get(user_id)
-    if not user or not user.is_artist:
-        return jsonify({"error": "Accès refusé : seul un artiste peut publier une œuvre."}), 403
-
-    data = request.get_json()
-    if not data.get("title") or not data.get("price"):
-        return jsonify({"error": "Le titre et le prix sont obligatoires."}), 400
-
-    artwork = Artwork(
-        title=data["title"],
-        description=data.get("description", ""),
-        price=float(data["price"]),
-        image_url=data.get("image_url", ""),
-        artist_id=user_id
-    )
-    db.session.add(artwork)
-    db.session.commit()
-    return jsonify({"message": "✅ Œuvre publiée avec succès"}), 201
-
-# 🟡 Nouvelle route : modifier une œuvre
-@app.route("/api/artworks/<int:artwork_id>", methods=["PATCH", "PUT"])
-@jwt_required()
-def update_artwork(artwork_id):
-    user_id = get_jwt_identity()
-    artwork = Artwork.query.get_or_404(artwork_id)
-    if artwork.artist_id != user_id:
-        return jsonify({"error": "⛔ Vous ne pouvez modifier que vos propres œuvres."}), 403
-
-    data = request.get_json()
-    if "title" in data:
-        artwork.title = data["title"]
-    if "description" in data:
-        artwork.description = data["description"]
-    if "price" in data:
-        artwork.price = float(data["price"])
-    if "image_url" in data:
-        artwork.image_url = data["image_url"]
-
-    db.session.commit()
-    return jsonify({"message": "✅ Œuvre mise à jour avec succès."}), 200
-
-
-# 🔴 Nouvelle route : supprimer une œuvre
-@app.route("/api/artworks/<int:artwork_id>", methods=["DELETE"])
-@jwt_required()
-def delete_artwork(artwork_id):
-    user_id = get_jwt_identity()
-    artwork = Artwork.query.get_or_404(artwork_id)
-    if artwork.artist_id != user_id:
-        return jsonify({"error": "⛔ Vous ne pouvez supprimer que vos propres œuvres."}), 403
-
-    db.session.delete(artwork)
-    db.session.commit()
-    return jsonify({"message": "🗑️ Œuvre supprimée avec succès."}), 200
-
-
-
-# ============================================================
-# ❤️ LIKE & 💬 COMMENTAIRES
-# ============================================================
-
-@app.route("/api/artworks/<int:artwork_id>/like", methods=["POST"])
-@jwt_required()
-def toggle_like(artwork_id):
-    user_id = get_jwt_identity()
-    artwork = Artwork.query.get_or_404(artwork_id)
-    existing_like = Like.query.filter_by(user_id=user_id, artwork_id=artwork_id).first()
-
-    if existing_like:
-        db.session.delete(existing_like)
-        db.session.commit()
-        return jsonify({"liked": False, "message": "Like retiré"}), 200
-
-    new_like = Like(user_id=user_id, artwork_id=artwork_id)
-    db.session.add(new_like)
-    db.session.commit()
-    return jsonify({"liked": True, "message": "Like ajouté"}), 201
-
-
-@app.route("/api/artworks/<int:artwork_id>/comments", methods=["GET"])
-def get_comments(artwork_id):
-    artwork = Artwork.query.get_or_404(artwork_id)
-    comments = [{
-        "id": c.id,
-        "content": c.content,
-        "author": c.user.username,
-        "created_at": c.created_at.strftime("%Y-%m-%d %H:%M")
-    } for c in artwork.comments]
-    return jsonify(comments), 200
-
-
-@app.route("/api/artworks/<int:artwork_id>/comments", methods=["POST"])
-@jwt_required()
-def add_comment(artwork_id):
-    user_id = get_jwt_identity()
-    data = request.get_json()
-    content = data.get("content", "").strip()
-
-    if not content:
-        return jsonify({"error": "Commentaire vide"}), 400
-
-    artwork = Artwork.query.get_or_404(artwork_id)
-    comment = Comment(content=content, user_id=user_id, artwork_id=artwork.id)
-    db.session.add(comment)
-    db.session.commit()
-
-    return jsonify({
-        "id": comment.id,
-        "content": comment.content,
-        "author": comment.user.username,
-        "created_at": comment.created_at.strftime("%Y-%m-%d %H:%M")
-    }), 201
-
-
-# ============================================================
-# 🛒 PANIER & CHECKOUT
-# ============================================================
-
-@app.route("/api/cart", methods=["GET"])
-@jwt_required()
-def get_cart():
-    user_id = get_jwt_identity()
-    items = Cart.query.filter_by(user_id=user_id).all()
-    return jsonify([{
-        "id": c.id, "title": c.artwork.title, "price": c.artwork.price, "image_url": c.artwork.image_url
-    } for c in items]), 200
-
-
-@app.route("/api/cart", methods=["POST"])
-@jwt_required()
-def add_to_cart():
-    user_id = get_jwt_identity()
-    data = request.get_json()
-    artwork_id = data.get("artwork_id")
-    if Cart.query.filter_by(user_id=user_id, artwork_id=artwork_id).first():
-        return jsonify({"error": "Déjà dans le panier"}), 400
-    db.session.add(Cart(user_id=user_id, artwork_id=artwork_id))
-    db.session.commit()
-    return jsonify({"message": "Ajoutée au panier"}), 201
-
-
-@app.route("/api/cart/<int:item_id>", methods=["DELETE"])
-@jwt_required()
-def remove_from_cart(item_id):
-    user_id = get_jwt_identity()
-    item = Cart.query.filter_by(id=item_id, user_id=user_id).first()
-    if not item:
-        return jsonify({"error": "Article introuvable"}), 404
-    db.session.delete(item)
-    db.session.commit()
-    return jsonify({"message": "Article retiré du panier"}), 200
-
-
-@app.route("/api/cart/checkout", methods=["POST"])
-@jwt_required()
-def checkout():
-    user_id = get_jwt_identity()
-    items = Cart.query.filter_by(user_id=user_id).all()
-    if not items:
-        return jsonify({"error": "Panier vide"}), 400
-    for item in items:
-        item.artwork.is_sold = True
-        db.session.delete(item)
-    db.session.commit()
-    return jsonify({"message": "Paiement réussi 🎉"}), 200
-
-
-# ============================================================
-# 📊 CATÉGORIES
-# ============================================================
-
-@app.route("/api/categories", methods=["GET"])
-def get_categories():
-    categories = Category.query.all()
-    return jsonify([{"id": c.id, "name": c.name} for c in categories]), 200
-
-
 # ============================================================
 # 🌐 PAGE D’ACCUEIL (TEST)
 # ============================================================
 
-@app.route('/')
 def home():
     return jsonify({
         "message": "✅ Serveur ArtGens.HT est en ligne sur Render",
@@ -425,21 +93,41 @@ def home():
             "/api/login",
             "/api/me",
             "/api/artworks",
+            "/api/artworks/<id>/related",
             "/api/artworks/<id>/like",
             "/api/artworks/<id>/comments",
             "/api/cart",
+            "/api/cart/summary",
             "/api/cart/checkout",
             "/api/categories"
         ]
     }), 200
 
 
+# ============================================================
+# 🔌 COMPATIBILITÉ `gunicorn app:app`
+# ============================================================
+
+_app = None
+
+
+def __getattr__(name):
+    """Construit `app` au premier accès (gunicorn app:app), jamais à l'import."""
+    global _app
+    if name == "app":
+        if _app is None:
+            _app = create_app()
+        return _app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 # ============================================================
 # 🚀 LANCEMENT DU SERVEUR
 # ============================================================
 
 if __name__ == "__main__":
-    init_db()
+    app = create_app()
+    init_db(app)
     port = int(os.environ.get("PORT", 5555))
     print(f"🚀 Serveur ArtGens.HT lancé sur http://0.0.0.0:{port}")
     app.run(debug=True, host="0.0.0.0", port=port)
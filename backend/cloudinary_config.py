@@ -1,17 +1,29 @@
-import cloudinary
-import cloudinary.uploader
-import cloudinary.api
+import os
 
+# Le SDK cloudinary est importé et configuré au premier upload seulement,
+# pour ne pas alourdir le démarrage des workers et des commandes CLI.
+_configured = False
+
+
+def _configure():
+    global _configured
+    import cloudinary
+
+    cloudinary.config(
+        cloud_name = os.environ.get("CLOUDINARY_CLOUD_NAME", "dvpkiqqqk"),
+        api_key = os.environ.get("CLOUDINARY_API_KEY", "123456789012345"),
+        api_secret = os.environ.get("CLOUDINARY_API_SECRET", "votre_api_secret_cloudinary")
+    )
+    _configured = True
 
-cloudinary.config(
-    cloud_name = "dvpkiqqqk",
-    api_key = "123456789012345",
-    api_secret = "votre_api_secret_cloudinary"
-)
 
 def upload_image(file):
     try:
+        if not _configured:
+            _configure()
+        import cloudinary.uploader
+
         result = cloudinary.uploader.upload(file)
         return result['secure_url']
     except Exception as e:
-        raise Exception(f"Erreur upload Cloudinary: {str(e)}")
\ No newline at end of file
+        raise Exception(f"Erreur upload Cloudinary: {str(e)}")
@@ -0,0 +1,51 @@
+import click
+from flask.cli import with_appcontext
+
+
+# ============================================================
+# 🛠️ COMMANDES CLI (flask <commande>)
+# ============================================================
+
+@click.command("build-related")
+@click.option("--top-k", default=20, show_default=True, help="Voisins conservés par œuvre.")
+@with_appcontext
+def build_related_command(top_k):
+    """Recalcule les œuvres similaires à partir des likes et catégories."""
+    # Import paresseux : numpy/scipy ne sont pas chargés par les workers web
+    from recommendations import build_related_index
+
+    written = build_related_index(top_k=top_k)
+    click.echo(f"✅ {written} recommandations enregistrées.")
+
+
+@click.command("purge-idempotency-keys")
+@with_appcontext
+def purge_idempotency_keys_command():
+    """Supprime les clés d'idempotence expirées (à planifier en cron)."""
+    from idempotency import purge_expired_keys
+
+    deleted = purge_expired_keys()
+    click.echo(f"🧹 {deleted} clés d'idempotence supprimées.")
+
+
+@click.command("backfill-price-cents")
+@click.option("--batch-size", default=1000, show_default=True, help="Œuvres converties par transaction.")
+@with_appcontext
+def backfill_price_cents_command(batch_size):
+    """Convertit les anciens prix flottants en centimes entiers."""
+    from pricing import backfill_price_cents
+
+    converted = backfill_price_cents(batch_size=batch_size)
+    click.echo(f"✅ {converted} prix convertis en centimes.")
+
+
+COMMANDS = (
+    build_related_command,
+    purge_idempotency_keys_command,
+    backfill_price_cents_command,
+)
+
+
+def register_commands(app):
+    for command in COMMANDS:
+        app.cli.add_command(command)
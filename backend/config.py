@@ -0,0 +1,26 @@
+import os
+from datetime import timedelta
+
+
+# ============================================================
+# ⚙️ CONFIGURATION DE L’APPLICATION
+# ============================================================
+
+class Config:
+    SECRET_KEY = os.environ.get('SECRET_KEY', 'votre_secret_super_securise')
+    JWT_SECRET_KEY = os.environ.get('JWT_SECRET_KEY', 'votre_jwt_secret')
+    JWT_ACCESS_TOKEN_EXPIRES = timedelta(days=7)
+    SQLALCHEMY_DATABASE_URI = os.environ.get('DATABASE_URL', 'sqlite:///artgens.db')
+    SQLALCHEMY_TRACK_MODIFICATIONS = False
+    # redis://… pour partager les compteurs entre workers gunicorn, sinon en mémoire
+    RATELIMIT_STORAGE_URL = os.environ.get('RATELIMIT_STORAGE_URL')
+    # Nombre de proxys de confiance devant l'app, dont l'IP cliente est lue dans
+    # X-Forwarded-For. 0 par défaut (sinon l'en-tête serait falsifiable) ;
+    # PROXY_FIX_X_FOR=1 dans l'environnement Render
+    PROXY_FIX_X_FOR = int(os.environ.get('PROXY_FIX_X_FOR', 0))
+    # Durée de conservation des réponses associées à un Idempotency-Key
+    IDEMPOTENCY_TTL = timedelta(hours=24)
+    # Au-delà, une réservation sans réponse est considérée abandonnée
+    IDEMPOTENCY_LOCK_TIMEOUT = timedelta(seconds=60)
+    # Devise des œuvres publiées sans devise explicite (code ISO 4217)
+    DEFAULT_CURRENCY = os.environ.get('DEFAULT_CURRENCY', 'USD')
@@ -0,0 +1,16 @@
+from flask_sqlalchemy import SQLAlchemy
+from flask_cors import CORS
+from flask_migrate import Migrate
+from flask_jwt_extended import JWTManager
+
+from rate_limit import RateLimiter
+
+
+# Extensions créées sans application, liées dans create_app()
+db = SQLAlchemy()
+# Une transaction par révision : une révision qui échoue n'annule pas les
+# précédentes (voir 129ea89e2dff, qui exige le backfill des prix)
+migrate = Migrate(transaction_per_migration=True)
+cors = CORS()
+jwt = JWTManager()
+limiter = RateLimiter()
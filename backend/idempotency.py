@@ -0,0 +1,128 @@
+import hashlib
+from datetime import datetime, timedelta
+from functools import wraps
+
+from flask import request, jsonify, current_app, make_response
+from flask_jwt_extended import get_jwt_identity
+from sqlalchemy.exc import IntegrityError
+
+from extensions import db
+from models import IdempotencyKey
+
+
+# ============================================================
+# 🔁 IDEMPOTENCE DES ÉCRITURES (en-tête Idempotency-Key)
+# ============================================================
+
+HEADER = "Idempotency-Key"
+REPLAYED_HEADER = "Idempotent-Replayed"
+DEFAULT_TTL = timedelta(hours=24)
+DEFAULT_LOCK_TIMEOUT = timedelta(seconds=60)
+
+
+def _ttl():
+    return current_app.config.get("IDEMPOTENCY_TTL", DEFAULT_TTL)
+
+
+def _lock_timeout():
+    return current_app.config.get("IDEMPOTENCY_LOCK_TIMEOUT", DEFAULT_LOCK_TIMEOUT)
+
+
+def _replay(record):
+    response = current_app.response_class(
+        record.response_body, status=record.status_code, mimetype="application/json"
+    )
+    response.headers[REPLAYED_HEADER] = "true"
+    return response
+
+
+def _take_over(record, now):
+    """Reprend une réservation abandonnée (worker tué avant d'enregistrer la réponse)."""
+    taken = IdempotencyKey.query.filter(
+        IdempotencyKey.id == record.id,
+        IdempotencyKey.status_code.is_(None),
+        IdempotencyKey.created_at < now - _lock_timeout(),
+    ).update({IdempotencyKey.created_at: now}, synchronize_session=False)
+    db.session.commit()
+    return taken == 1
+
+
+def _reserve(key, user_id):
+    """Réserve la clé ; retourne (record, None) ou (None, réponse à renvoyer)."""
+    now = datetime.utcnow()
+    request_hash = hashlib.sha256(request.get_data()).hexdigest()
+    record = IdempotencyKey.query.filter_by(user_id=user_id, key=key).first()
+    if record and record.created_at < now - _ttl():
+        db.session.delete(record)
+        db.session.commit()
+        record = None
+
+    if record is None:
+        record = IdempotencyKey(
+            key=key, user_id=user_id, method=request.method, path=request.path,
+            request_hash=request_hash
+        )
+        db.session.add(record)
+        try:
+            db.session.commit()
+            return record, None
+        except IntegrityError:
+            # Une autre tentative vient de réserver la même clé
+            db.session.rollback()
+            record = IdempotencyKey.query.filter_by(user_id=user_id, key=key).first()
+        if record is None:
+            # ... et l'a déjà libérée après un échec : le client peut réessayer
+            return None, (jsonify({"error": "Requête identique en cours, réessayez"}), 409)
+
+    if (record.method, record.path, record.request_hash) != (request.method, request.path, request_hash):
+        return None, (jsonify({"error": "Clé d'idempotence déjà utilisée pour une autre requête"}), 422)
+    if record.status_code is None:
+        if _take_over(record, now):
+            return record, None
+        return None, (jsonify({"error": "Requête identique déjà en cours de traitement"}), 409)
+    return None, _replay(record)
+
+
+def idempotent(f):
+    """Rejoue la première réponse d'une route si l'en-tête Idempotency-Key est répété.
+
+    À placer sous `@jwt_required()` : les clés sont propres à chaque utilisateur.
+    """
+    @wraps(f)
+    def decorated(*args, **kwargs):
+        key = request.headers.get(HEADER, "").strip()
+        if not key:
+            return f(*args, **kwargs)
+        if len(key) > 255:
+            return jsonify({"error": "Clé d'idempotence trop longue"}), 400
+
+        record, early = _reserve(key, get_jwt_identity())
+        if early is not None:
+            return early
+
+        try:
+            response = make_response(f(*args, **kwargs))
+        except Exception:
+            db.session.rollback()
+            db.session.delete(record)
+            db.session.commit()
+            raise
+
+        if response.status_code >= 500:
+            # Erreur serveur : la tentative suivante doit pouvoir rejouer l'écriture
+            db.session.delete(record)
+        else:
+            record.status_code = response.status_code
+            record.response_body = response.get_data(as_text=True)
+        db.session.commit()
+        return response
+    return decorated
+
+
+def purge_expired_keys():
+    """Supprime les clés plus anciennes que IDEMPOTENCY_TTL ; retourne leur nombre."""
+    deleted = IdempotencyKey.query.filter(
+        IdempotencyKey.created_at < datetime.utcnow() - _ttl()
+    ).delete(synchronize_session=False)
+    db.session.commit()
+    return deleted
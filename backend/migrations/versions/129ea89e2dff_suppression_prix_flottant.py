@@ -0,0 +1,44 @@
+"""suppression prix flottant
+
+Étape « contract » : rend price_cents obligatoire et supprime l'ancienne
+colonne flottante. Refuse de s'appliquer tant que des lignes n'ont pas été
+converties par `flask backfill-price-cents` (par lots validés), pour ne pas
+réécrire toute la table dans une seule transaction.
+
+Revision ID: 129ea89e2dff
+Revises: e711313c6f6f
+Create Date: 2026-10-19 16:24:10.093157
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '129ea89e2dff'
+down_revision = 'e711313c6f6f'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    remaining = op.get_bind().execute(sa.text(
+        "SELECT COUNT(*) FROM artwork WHERE price_cents IS NULL"
+    )).scalar()
+    if remaining:
+        raise RuntimeError(
+            f"{remaining} œuvre(s) sans price_cents : lancez `flask db upgrade e711313c6f6f`, "
+            "puis `flask backfill-price-cents`, puis de nouveau `flask db upgrade`."
+        )
+
+    with op.batch_alter_table('artwork', schema=None) as batch_op:
+        batch_op.alter_column('price_cents', existing_type=sa.BigInteger(), nullable=False)
+        batch_op.drop_column('price')
+
+
+def downgrade():
+    with op.batch_alter_table('artwork', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('price', sa.Float(), nullable=True))
+    op.execute("UPDATE artwork SET price = price_cents / 100.0")
+    with op.batch_alter_table('artwork', schema=None) as batch_op:
+        batch_op.alter_column('price_cents', existing_type=sa.BigInteger(), nullable=True)
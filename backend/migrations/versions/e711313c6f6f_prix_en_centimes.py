@@ -0,0 +1,39 @@
+"""prix en centimes
+
+Ajoute artwork.price_cents et artwork.currency à côté de l'ancienne
+colonne flottante, rendue facultative. Le server_default 'USD' ne sert
+qu'à ajouter la colonne ; le backfill applique DEFAULT_CURRENCY. Lancer ensuite
+`flask backfill-price-cents` avant la révision 129ea89e2dff.
+
+Revision ID: e711313c6f6f
+Revises: 1aff1d363665
+Create Date: 2026-10-19 16:21:48.730512
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e711313c6f6f'
+down_revision = '1aff1d363665'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('artwork', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('price_cents', sa.BigInteger(), nullable=True))
+        batch_op.add_column(sa.Column('currency', sa.String(length=3), server_default='USD', nullable=False))
+        batch_op.alter_column('price', existing_type=sa.Float(), nullable=True)
+        batch_op.create_index('ix_artwork_price_cents', ['price_cents'], unique=False)
+        batch_op.create_index('ix_artwork_is_sold_price_cents', ['is_sold', 'price_cents'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('artwork', schema=None) as batch_op:
+        batch_op.drop_index('ix_artwork_is_sold_price_cents')
+        batch_op.drop_index('ix_artwork_price_cents')
+        batch_op.alter_column('price', existing_type=sa.Float(), nullable=False)
+        batch_op.drop_column('currency')
+        batch_op.drop_column('price_cents')
@@ -0,0 +1,118 @@
+from datetime import datetime
+
+from werkzeug.security import generate_password_hash, check_password_hash
+
+from extensions import db
+
+
+# ============================================================
+# 👥 MODÈLES
+# ============================================================
+
+class User(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    username = db.Column(db.String(80), unique=True, nullable=False)
+    email = db.Column(db.String(120), unique=True, nullable=False)
+    password_hash = db.Column(db.String(128))
+    is_artist = db.Column(db.Boolean, default=False)
+    bio = db.Column(db.Text)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    artworks = db.relationship('Artwork', backref='artist', lazy=True)
+    likes = db.relationship('Like', backref='user', lazy=True)
+    comments = db.relationship('Comment', backref='user', lazy=True)
+    cart_items = db.relationship('Cart', backref='user', lazy=True)
+
+    def set_password(self, password):
+        self.password_hash = generate_password_hash(password)
+    
+    def check_password(self, password):
+        return check_password_hash(self.password_hash, password)
+
+
+class Category(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    name = db.Column(db.String(50), unique=True, nullable=False)
+
+
+artwork_categories = db.Table(
+    'artwork_categories',
+    db.Column('artwork_id', db.Integer, db.ForeignKey('artwork.id'), primary_key=True),
+    db.Column('category_id', db.Integer, db.ForeignKey('category.id'), primary_key=True)
+)
+
+
+class Artwork(db.Model):
+    __table_args__ = (
+        db.Index('ix_artwork_price_cents', 'price_cents'),
+        db.Index('ix_artwork_is_sold_price_cents', 'is_sold', 'price_cents'),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    title = db.Column(db.String(100), nullable=False)
+    description = db.Column(db.Text)
+    # Prix en centimes entiers (voir pricing.py), jamais en flottant
+    price_cents = db.Column(db.BigInteger, nullable=False)
+    # Pas de défaut côté modèle : create_artwork applique DEFAULT_CURRENCY et le
+    # backfill aussi ; le server_default ne sert qu'à ajouter la colonne NOT NULL
+    currency = db.Column(db.String(3), nullable=False, server_default='USD')
+    image_url = db.Column(db.String(200))
+    is_sold = db.Column(db.Boolean, default=False)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    artist_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
+    categories = db.relationship('Category', secondary=artwork_categories, backref='artworks')
+    likes = db.relationship('Like', backref='artwork', lazy=True)
+    comments = db.relationship('Comment', backref='artwork', lazy=True)
+    in_carts = db.relationship('Cart', backref='artwork', lazy=True)
+
+
+class Like(db.Model):
+    __table_args__ = (db.UniqueConstraint('user_id', 'artwork_id', name='uq_like_user_artwork'),)
+
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
+    artwork_id = db.Column(db.Integer, db.ForeignKey('artwork.id'), nullable=False)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+
+class Comment(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    content = db.Column(db.Text, nullable=False)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
+    artwork_id = db.Column(db.Integer, db.ForeignKey('artwork.id'), nullable=False)
+
+
+class Cart(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
+    artwork_id = db.Column(db.Integer, db.ForeignKey('artwork.id'), nullable=False)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+
+class RelatedArtwork(db.Model):
+    """Voisins pré-calculés par `flask build-related` (voir recommendations.py)."""
+    artwork_id = db.Column(db.Integer, db.ForeignKey('artwork.id', ondelete='CASCADE'), primary_key=True)
+    rank = db.Column(db.Integer, primary_key=True)
+    related_id = db.Column(db.Integer, db.ForeignKey('artwork.id', ondelete='CASCADE'), nullable=False)
+    score = db.Column(db.Float, nullable=False)
+
+    related = db.relationship('Artwork', foreign_keys=[related_id])
+
+
+class IdempotencyKey(db.Model):
+    """Réponse mémorisée d'une requête d'écriture (en-tête Idempotency-Key)."""
+    __table_args__ = (db.UniqueConstraint('user_id', 'key'),)
+
+    id = db.Column(db.Integer, primary_key=True)
+    key = db.Column(db.String(255), nullable=False)
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
+    method = db.Column(db.String(10), nullable=False)
+    path = db.Column(db.String(255), nullable=False)
+    # SHA-256 du corps : une clé réutilisée avec un autre contenu est refusée
+    request_hash = db.Column(db.String(64), nullable=False)
+    # NULL tant que la première tentative n'est pas terminée
+    status_code = db.Column(db.Integer)
+    response_body = db.Column(db.Text)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
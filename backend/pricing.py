@@ -0,0 +1,88 @@
+from decimal import Decimal, InvalidOperation, ROUND_HALF_UP
+
+from flask import current_app
+from sqlalchemy import inspect, text
+
+from extensions import db
+
+
+# ============================================================
+# 💲 PRIX EN CENTIMES ENTIERS
+# ============================================================
+
+CENT = Decimal("0.01")
+# Plafond métier (100 millions), très en deçà de la limite d'un BIGINT
+MAX_PRICE_CENTS = 100_000_000 * 100
+
+
+def parse_price_cents(value, minimum=0):
+    """Convertit "12.5", 12.5 ou "12,50" en 1250 ; lève ValueError si invalide.
+
+    Le résultat arrondi doit être compris entre `minimum` et MAX_PRICE_CENTS :
+    minimum=1 refuse "0", "-0" comme "0.001" pour le prix d'une œuvre.
+    """
+    try:
+        amount = Decimal(str(value).strip().replace(",", "."))
+        if not amount.is_finite() or amount < 0:
+            raise InvalidOperation
+        cents = int(amount.quantize(CENT, rounding=ROUND_HALF_UP) * 100)
+    except InvalidOperation:
+        raise ValueError(f"Prix invalide : {value!r}")
+    if not minimum <= cents <= MAX_PRICE_CENTS:
+        raise ValueError(f"Prix invalide : {value!r}")
+    return cents
+
+
+def format_cents(cents):
+    """Convertit 1250 en "12.50" (chaîne décimale servie par l'API)."""
+    if cents is None:
+        return None
+    return str((Decimal(cents) / 100).quantize(CENT))
+
+
+def parse_currency(value):
+    currency = str(value).strip().upper()
+    if len(currency) != 3 or not currency.isalpha():
+        raise ValueError(f"Devise invalide : {value!r}")
+    return currency
+
+
+def backfill_price_cents(batch_size=1000):
+    """Remplit artwork.price_cents depuis l'ancienne colonne flottante, par lots d'id.
+
+    L'arrondi passe par parse_price_cents (demi vers le haut sur la valeur
+    décimale affichée) pour donner le même résultat que l'API, quel que soit
+    le SGBD. Les lignes converties reçoivent DEFAULT_CURRENCY. Chaque lot est
+    validé séparément pour ne pas verrouiller toute la table ; la commande
+    peut être relancée sans risque. Retourne le nombre de lignes converties.
+    """
+    columns = {c["name"] for c in inspect(db.engine).get_columns("artwork")}
+    if "price" not in columns:
+        return 0
+
+    bounds = db.session.execute(text(
+        "SELECT MIN(id), MAX(id) FROM artwork WHERE price_cents IS NULL"
+    )).one()
+    if bounds[0] is None:
+        return 0
+
+    currency = current_app.config["DEFAULT_CURRENCY"]
+    converted = 0
+    for low in range(bounds[0], bounds[1] + 1, batch_size):
+        rows = db.session.execute(text(
+            "SELECT id, price FROM artwork "
+            "WHERE id >= :low AND id < :high AND price_cents IS NULL AND price IS NOT NULL"
+        ), {"low": low, "high": low + batch_size}).all()
+        if not rows:
+            continue
+        # repr() donne la plus courte écriture décimale du flottant : 1.005 et non 1.00499…
+        db.session.execute(text(
+            "UPDATE artwork SET price_cents = :cents, currency = :currency "
+            "WHERE id = :id AND price_cents IS NULL"
+        ), [
+            {"id": row.id, "cents": parse_price_cents(repr(row.price)), "currency": currency}
+            for row in rows
+        ])
+        db.session.commit()
+        converted += len(rows)
+    return converted
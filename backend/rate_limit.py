@@ -0,0 +1,208 @@
+import logging
+import math
+import threading
+import time
+from collections import deque
+from functools import wraps
+
+from flask import request, jsonify, current_app
+from flask_jwt_extended import verify_jwt_in_request, get_jwt_identity
+
+logger = logging.getLogger(__name__)
+
+# ============================================================
+# ⏱️ LIMITATION DE DÉBIT (fenêtre glissante)
+# ============================================================
+
+PERIODS = {
+    "second": 1,
+    "minute": 60,
+    "hour": 3600,
+    "day": 86400,
+}
+
+
+def parse_limit(limit):
+    """Convertit "30/minute" en (30, 60)."""
+    count, _, period = limit.partition("/")
+    period = period.strip().rstrip("s")
+    if period not in PERIODS:
+        raise ValueError(f"Période de limitation inconnue : {limit!r}")
+    return int(count), PERIODS[period]
+
+
+class MemoryStore:
+    """Fenêtre glissante en mémoire, pour un déploiement mono-processus."""
+
+    # Nombre d'appels entre deux purges des clés inactives.
+    SWEEP_EVERY = 10000
+
+    def __init__(self):
+        self._hits = {}
+        self._calls = 0
+        self._lock = threading.Lock()
+
+    def hit(self, key, limit, window):
+        """Enregistre un appel et retourne (autorisé, restant, retry_after)."""
+        now = time.monotonic()
+        with self._lock:
+            self._calls += 1
+            if self._calls % self.SWEEP_EVERY == 0:
+                self._sweep(now)
+            entry = self._hits.get(key)
+            if entry is None:
+                entry = self._hits[key] = (deque(), window)
+            hits = entry[0]
+            while hits and hits[0] <= now - window:
+                hits.popleft()
+            if len(hits) >= limit:
+                return False, 0, hits[0] + window - now
+            hits.append(now)
+            return True, limit - len(hits), 0
+
+    def _sweep(self, now):
+        expired = [
+            key for key, (hits, window) in self._hits.items()
+            if not hits or hits[-1] <= now - window
+        ]
+        for key in expired:
+            del self._hits[key]
+
+    def reset(self):
+        with self._lock:
+            self._hits.clear()
+
+
+# Script Lua exécuté de façon atomique côté Redis : purge la fenêtre,
+# compte les appels restants puis enregistre l'appel courant.
+_REDIS_SLIDING_WINDOW = """
+local key = KEYS[1]
+local now = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local limit = tonumber(ARGV[3])
+local member = ARGV[4]
+redis.call('ZREMRANGEBYSCORE', key, '-inf', now - window)
+local count = redis.call('ZCARD', key)
+if count >= limit then
+    local oldest = redis.call('ZRANGE', key, 0, 0, 'WITHSCORES')
+    return {0, 0, tostring(tonumber(oldest[2]) + window - now)}
+end
+redis.call('ZADD', key, now, member)
+redis.call('EXPIRE', key, math.ceil(window))
+return {1, limit - count - 1, '0'}
+"""
+
+
+class RedisStore:
+    """Fenêtre glissante partagée entre workers (Redis ou compatible)."""
+
+    def __init__(self, url, prefix="ratelimit:"):
+        # Import paresseux : redis n'est requis qu'en mode multi-workers.
+        import redis
+
+        self._errors = redis.RedisError
+        self._client = redis.Redis.from_url(url)
+        self._script = self._client.register_script(_REDIS_SLIDING_WINDOW)
+        self._prefix = prefix
+        self._counter = 0
+        self._lock = threading.Lock()
+
+    def _member(self, now):
+        with self._lock:
+            self._counter += 1
+            return f"{now}:{threading.get_ident()}:{self._counter}"
+
+    def hit(self, key, limit, window):
+        now = time.time()
+        try:
+            allowed, remaining, retry_after = self._script(
+                keys=[self._prefix + key],
+                args=[now, window, limit, self._member(now)],
+            )
+        except self._errors:
+            # Une panne du limiteur ne doit pas bloquer l'API (login compris)
+            logger.exception("Limiteur Redis indisponible, requête autorisée")
+            return True, limit, 0
+        return bool(allowed), int(remaining), float(retry_after)
+
+    def reset(self):
+        for key in self._client.scan_iter(self._prefix + "*"):
+            self._client.delete(key)
+
+
+def create_store(url):
+    if url and url.startswith(("redis://", "rediss://", "unix://")):
+        return RedisStore(url)
+    return MemoryStore()
+
+
+class RateLimiter:
+    """Middleware de limitation, configuré route par route via `limit()`."""
+
+    def __init__(self, app=None):
+        self.store = None
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.config.setdefault("RATELIMIT_ENABLED", True)
+        app.config.setdefault("RATELIMIT_STORAGE_URL", None)
+        self.store = create_store(app.config["RATELIMIT_STORAGE_URL"])
+        app.extensions["rate_limiter"] = self
+        app.before_request(self._check)
+        app.after_request(self._inject_headers)
+
+    def limit(self, limit):
+        """Déclare le budget d'une route, ex. `@limiter.limit("30/minute")`."""
+        budget = parse_limit(limit)
+
+        def decorator(f):
+            @wraps(f)
+            def wrapper(*args, **kwargs):
+                return f(*args, **kwargs)
+            wrapper._rate_limit = budget
+            return wrapper
+        return decorator
+
+    @staticmethod
+    def _identity():
+        try:
+            verify_jwt_in_request(optional=True)
+            user_id = get_jwt_identity()
+        except Exception:
+            user_id = None
+        if user_id is not None:
+            return f"user:{user_id}"
+        return f"ip:{request.remote_addr}"
+
+    def _check(self):
+        if not current_app.config["RATELIMIT_ENABLED"] or request.endpoint is None:
+            return None
+        # Les preflights CORS ne portent pas de JWT et ne doivent rien consommer
+        if request.method == "OPTIONS":
+            return None
+        view = current_app.view_functions.get(request.endpoint)
+        budget = getattr(view, "_rate_limit", None)
+        if budget is None:
+            return None
+
+        limit, window = budget
+        key = f"{request.endpoint}:{self._identity()}"
+        allowed, remaining, retry_after = self.store.hit(key, limit, window)
+        request.environ["ratelimit.headers"] = {
+            "X-RateLimit-Limit": str(limit),
+            "X-RateLimit-Remaining": str(remaining),
+        }
+        if allowed:
+            return None
+
+        response = jsonify({"error": "Trop de requêtes, veuillez réessayer plus tard."})
+        response.status_code = 429
+        response.headers["Retry-After"] = str(max(1, math.ceil(retry_after)))
+        return response
+
+    @staticmethod
+    def _inject_headers(response):
+        for name, value in request.environ.get("ratelimit.headers", {}).items():
+            response.headers.setdefault(name, value)
+        return response
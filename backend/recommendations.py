@@ -0,0 +1,169 @@
+import numpy as np
+from scipy import sparse
+from sqlalchemy import delete, insert, select
+
+from extensions import db
+from models import Artwork, Like, RelatedArtwork, artwork_categories
+
+
+# ============================================================
+# 🔗 ŒUVRES SIMILAIRES (co-occurrence item-item)
+# ============================================================
+
+# Poids de la similarité par catégories face à la similarité par likes
+CATEGORY_WEIGHT = 0.25
+# Nombre d'œuvres traitées par bloc de produit matriciel
+BLOCK_SIZE = 2048
+# Les comptes au-delà de ce nombre de likes (robots, likes en masse) sont
+# ignorés : ils relieraient chaque œuvre à presque toutes les autres
+MAX_USER_LIKES = 500
+# Candidats retenus par catégorie (les plus aimés, puis les plus récents) pour
+# compléter les œuvres qui ont moins de top_k voisins co-aimés
+MAX_CATEGORY_CANDIDATES = 100
+# Nombre de lignes insérées par requête
+INSERT_BATCH = 10000
+
+
+def _load_pairs(columns, batch=100000):
+    """Charge une table de liaison en deux tableaux int64, par lots."""
+    result = db.session.execute(select(*columns).execution_options(yield_per=batch))
+    left, right = [], []
+    for rows in result.partitions():
+        chunk = np.asarray(rows, dtype=np.int64).reshape(-1, 2)
+        left.append(chunk[:, 0])
+        right.append(chunk[:, 1])
+    if not left:
+        return np.empty(0, np.int64), np.empty(0, np.int64)
+    return np.concatenate(left), np.concatenate(right)
+
+
+def _incidence(rows, item_ids, artwork_index):
+    """Matrice binaire items x (utilisateurs|catégories), normalisée L2 par ligne."""
+    keep = np.isin(item_ids, artwork_index)
+    rows, item_ids = rows[keep], item_ids[keep]
+    items = np.searchsorted(artwork_index, item_ids)
+    _, cols = np.unique(rows, return_inverse=True)
+    n_cols = int(cols.max()) + 1 if cols.size else 0
+
+    matrix = sparse.csr_matrix(
+        (np.ones(items.size, dtype=np.float32), (items, cols)),
+        shape=(artwork_index.size, n_cols),
+    )
+    matrix.sum_duplicates()
+    matrix.data[:] = 1.0
+    norms = np.sqrt(np.asarray(matrix.sum(axis=1)).ravel())
+    norms[norms == 0] = 1.0
+    return sparse.diags(1.0 / norms) @ matrix
+
+
+def _top_k(block, offset, k):
+    """Extrait les k meilleurs voisins de chaque ligne d'un bloc CSR."""
+    block = block.tocsr()
+    for row in range(block.shape[0]):
+        start, end = block.indptr[row], block.indptr[row + 1]
+        scores = block.data[start:end]
+        cols = block.indices[start:end]
+        # Une œuvre n'est pas sa propre voisine
+        others = (cols != offset + row) & (scores > 0)
+        scores, cols = scores[others], cols[others]
+        if scores.size == 0:
+            continue
+        if scores.size > k:
+            best = np.argpartition(-scores, k - 1)[:k]
+            scores, cols = scores[best], cols[best]
+        order = np.argsort(-scores, kind="stable")
+        yield offset + row, cols[order], scores[order]
+
+
+def _category_candidates(tags, popularity, cap):
+    """Pour chaque catégorie, les `cap` œuvres les plus aimées puis les plus récentes."""
+    by_category = tags.tocsc()
+    candidates = []
+    for category in range(by_category.shape[1]):
+        rows = by_category.indices[by_category.indptr[category]:by_category.indptr[category + 1]]
+        order = np.lexsort((-rows, -popularity[rows]))[:cap]
+        candidates.append(rows[order])
+    return candidates
+
+
+def _category_fallback(row, cols, scores, tags, candidates, k):
+    """Complète les voisins d'une œuvre avec des œuvres de ses catégories."""
+    categories = tags.indices[tags.indptr[row]:tags.indptr[row + 1]]
+    if categories.size == 0:
+        return cols, scores
+    pool = np.unique(np.concatenate([candidates[c] for c in categories]))
+    pool = pool[(pool != row) & ~np.isin(pool, cols)]
+    if pool.size == 0:
+        return cols, scores
+    extra = CATEGORY_WEIGHT * (tags[pool] @ tags[row].T).toarray().ravel()
+    best = np.argsort(-extra, kind="stable")[:k - cols.size]
+    return np.concatenate([cols, pool[best]]), np.concatenate([scores, extra[best]])
+
+
+def build_related_index(top_k=20):
+    """Recalcule la table related_artwork ; retourne le nombre de lignes écrites.
+
+    Similarité cosinus sur les likes communs, reclassée par la similarité
+    cosinus sur les catégories. Les œuvres avec moins de top_k voisins
+    co-aimés (peu ou pas de likes) sont complétées, après ceux-ci, par les
+    candidats de leurs catégories. Le produit L·Lᵀ est calculé par blocs
+    d'œuvres et, les comptes très actifs étant écartés, chaque bloc reste
+    creux : au plus BLOCK_SIZE × likes par œuvre × MAX_USER_LIKES valeurs non
+    nulles ; le complément est borné par MAX_CATEGORY_CANDIDATES par catégorie.
+    """
+    artwork_index = np.fromiter(
+        db.session.execute(select(Artwork.id).order_by(Artwork.id)).scalars(),
+        dtype=np.int64,
+    )
+    if artwork_index.size == 0:
+        return 0
+
+    users, liked = _load_pairs([Like.user_id, Like.artwork_id])
+    active, counts = np.unique(users, return_counts=True)
+    keep = ~np.isin(users, active[counts > MAX_USER_LIKES])
+    users, liked = users[keep], liked[keep]
+    likes = _incidence(users, liked, artwork_index)
+    categories, tagged = _load_pairs([
+        artwork_categories.c.category_id, artwork_categories.c.artwork_id
+    ])
+    tags = _incidence(categories, tagged, artwork_index).tocsr()
+
+    likes = likes.tocsr()
+    likes_t = likes.T.tocsr()
+    popularity = np.diff(likes.indptr)
+    candidates = _category_candidates(tags, popularity, MAX_CATEGORY_CANDIDATES)
+    no_neighbours = (np.empty(0, np.int64), np.empty(0, np.float32))
+
+    db.session.execute(delete(RelatedArtwork))
+    pending = []
+    written = 0
+    for offset in range(0, artwork_index.size, BLOCK_SIZE):
+        stop = min(offset + BLOCK_SIZE, artwork_index.size)
+        block = (likes[offset:stop] @ likes_t).tocoo()
+        if block.nnz:
+            # Catégories communes, évaluées seulement sur les paires co-aimées
+            shared = tags[block.row + offset].multiply(tags[block.col]).sum(axis=1)
+            block.data = block.data + CATEGORY_WEIGHT * np.asarray(shared).ravel()
+        neighbours = {row: (cols, scores) for row, cols, scores in _top_k(block, offset, top_k)}
+        for row in range(offset, stop):
+            cols, scores = neighbours.get(row, no_neighbours)
+            if cols.size < top_k:
+                cols, scores = _category_fallback(row, cols, scores, tags, candidates, top_k)
+            if cols.size == 0:
+                continue
+            artwork_id = int(artwork_index[row])
+            pending.extend(
+                {"artwork_id": artwork_id, "rank": rank,
+                 "related_id": int(artwork_index[col]), "score": float(score)}
+                for rank, (col, score) in enumerate(zip(cols, scores))
+            )
+        if len(pending) >= INSERT_BATCH:
+            db.session.execute(insert(RelatedArtwork), pending)
+            written += len(pending)
+            pending = []
+
+    if pending:
+        db.session.execute(insert(RelatedArtwork), pending)
+        written += len(pending)
+    db.session.commit()
+    return written
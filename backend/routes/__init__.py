@@ -0,0 +1,9 @@
+from routes import auth, artworks, social, cart, categories
+
+
+BLUEPRINTS = (auth.bp, artworks.bp, social.bp, cart.bp, categories.bp)
+
+
+def register_blueprints(app):
+    for blueprint in BLUEPRINTS:
+        app.register_blueprint(blueprint)
@@ -0,0 +1,158 @@
+from flask import Blueprint, request, jsonify, current_app
+from flask_jwt_extended import jwt_required, get_jwt_identity
+
+from extensions import db, limiter
+from idempotency import idempotent
+from models import Artwork, RelatedArtwork, User
+from pricing import format_cents, parse_currency, parse_price_cents
+
+bp = Blueprint('artworks', __name__)
+
+
+# ============================================================
+# 🎨 GESTION DES ŒUVRES
+# ============================================================
+
+@bp.route("/api/artworks", methods=["GET"])
+@limiter.limit("60/minute")
+def get_artworks():
+    query = Artwork.query
+    # Plage et tri de prix : index price_cents, ou (is_sold, price_cents)
+    # quand seules les œuvres disponibles sont demandées
+    try:
+        if request.args.get("min_price"):
+            query = query.filter(Artwork.price_cents >= parse_price_cents(request.args["min_price"]))
+        if request.args.get("max_price"):
+            query = query.filter(Artwork.price_cents <= parse_price_cents(request.args["max_price"]))
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    if request.args.get("available") == "true":
+        query = query.filter(Artwork.is_sold.is_(False))
+
+    sort = request.args.get("sort")
+    if sort == "price_asc":
+        query = query.order_by(Artwork.price_cents.asc(), Artwork.id)
+    elif sort == "price_desc":
+        query = query.order_by(Artwork.price_cents.desc(), Artwork.id)
+    else:
+        query = query.order_by(Artwork.created_at.desc())
+
+    artworks = query.all()
+    return jsonify([{
+        "id": a.id,
+        "title": a.title,
+        "description": a.description,
+        "price": format_cents(a.price_cents),
+        "price_cents": a.price_cents,
+        "currency": a.currency,
+        "image_url": a.image_url,
+        "artist_id": a.artist_id,
+        "artist_name": a.artist.username if a.artist else None,
+        "likes_count": len(a.likes),
+        "is_sold": a.is_sold,
+        "created_at": a.created_at.isoformat()
+    } for a in artworks]), 200
+
+
+# 🔗 Œuvres similaires, pré-calculées par `flask build-related`
+@bp.route("/api/artworks/<int:artwork_id>/related", methods=["GET"])
+@limiter.limit("60/minute")
+def get_related_artworks(artwork_id):
+    limit = max(1, min(request.args.get("limit", 10, type=int), 50))
+    related = (
+        RelatedArtwork.query
+        .filter_by(artwork_id=artwork_id)
+        .join(RelatedArtwork.related)
+        .options(db.contains_eager(RelatedArtwork.related))
+        .order_by(RelatedArtwork.rank)
+        .limit(limit)
+        .all()
+    )
+    if not related:
+        # Pas de voisins : distinguer une œuvre sans recommandations d'une œuvre inconnue
+        Artwork.query.get_or_404(artwork_id)
+    return jsonify([{
+        "id": r.related.id,
+        "title": r.related.title,
+        "price": format_cents(r.related.price_cents),
+        "price_cents": r.related.price_cents,
+        "currency": r.related.currency,
+        "image_url": r.related.image_url,
+        "artist_id": r.related.artist_id,
+        "is_sold": r.related.is_sold,
+        "score": round(r.score, 4)
+    } for r in related]), 200
+
+
+@bp.route("/api/artworks", methods=["POST"])
+@limiter.limit("30/hour")
+@jwt_required()
+@idempotent
+def create_artwork():
+    user_id = get_jwt_identity()
+    user = User.query.get(user_id)
+    if not user or not user.is_artist:
+        return jsonify({"error": "Accès refusé : seul un artiste peut publier une œuvre."}), 403
+
+    data = request.get_json()
+    if not data.get("title") or data.get("price") in (None, ""):
+        return jsonify({"error": "Le titre et le prix sont obligatoires."}), 400
+    try:
+        price_cents = parse_price_cents(data["price"], minimum=1)
+        currency = parse_currency(data.get("currency", current_app.config["DEFAULT_CURRENCY"]))
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    artwork = Artwork(
+        title=data["title"],
+        description=data.get("description", ""),
+        price_cents=price_cents,
+        currency=currency,
+        image_url=data.get("image_url", ""),
+        artist_id=user_id
+    )
+    db.session.add(artwork)
+    db.session.commit()
+    return jsonify({"message": "✅ Œuvre publiée avec succès"}), 201
+
+# 🟡 Nouvelle route : modifier une œuvre
+@bp.route("/api/artworks/<int:artwork_id>", methods=["PATCH", "PUT"])
+@limiter.limit("30/minute")
+@jwt_required()
+def update_artwork(artwork_id):
+    user_id = get_jwt_identity()
+    artwork = Artwork.query.get_or_404(artwork_id)
+    if artwork.artist_id != user_id:
+        return jsonify({"error": "⛔ Vous ne pouvez modifier que vos propres œuvres."}), 403
+
+    data = request.get_json()
+    if "title" in data:
+        artwork.title = data["title"]
+    if "description" in data:
+        artwork.description = data["description"]
+    try:
+        if "price" in data:
+            artwork.price_cents = parse_price_cents(data["price"], minimum=1)
+        if "currency" in data:
+            artwork.currency = parse_currency(data["currency"])
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    if "image_url" in data:
+        artwork.image_url = data["image_url"]
+
+    db.session.commit()
+    return jsonify({"message": "✅ Œuvre mise à jour avec succès."}), 200
+
+# 🔴 Nouvelle route : supprimer une œuvre
+@bp.route("/api/artworks/<int:artwork_id>", methods=["DELETE"])
+@limiter.limit("30/minute")
+@jwt_required()
+def delete_artwork(artwork_id):
+    user_id = get_jwt_identity()
+    artwork = Artwork.query.get_or_404(artwork_id)
+    if artwork.artist_id != user_id:
+        return jsonify({"error": "⛔ Vous ne pouvez supprimer que vos propres œuvres."}), 403
+
+    db.session.delete(artwork)
+    db.session.commit()
+    return jsonify({"message": "🗑️ Œuvre supprimée avec succès."}), 200
@@ -0,0 +1,75 @@
+from flask import Blueprint, request, jsonify
+from flask_jwt_extended import create_access_token, jwt_required, get_jwt_identity
+
+from extensions import db, limiter
+from models import User
+
+bp = Blueprint('auth', __name__)
+
+
+# ============================================================
+# 🔐 AUTHENTIFICATION
+# ============================================================
+
+@bp.route("/api/register", methods=["POST"])
+@limiter.limit("5/minute")
+def register():
+    data = request.get_json()
+    if not data or "email" not in data or "password" not in data:
+        return jsonify({"error": "Champs requis manquants"}), 400
+
+    if User.query.filter_by(email=data["email"]).first():
+        return jsonify({"error": "Email déjà utilisé"}), 400
+
+    user = User(
+        username=data.get("username", data["email"].split("@")[0]),
+        email=data["email"],
+        is_artist=data.get("is_artist", False),
+        bio=data.get("bio", "")
+    )
+    user.set_password(data["password"])
+    db.session.add(user)
+    db.session.commit()
+
+    token = create_access_token(identity=user.id)
+    return jsonify({
+        "token": token,
+        "user": {
+            "id": user.id, "username": user.username,
+            "email": user.email, "is_artist": user.is_artist, "bio": user.bio
+        }
+    }), 201
+
+
+@bp.route("/api/login", methods=["POST"])
+@limiter.limit("10/minute")
+def login():
+    data = request.get_json()
+    if not data or "email" not in data or "password" not in data:
+        return jsonify({"error": "Champs requis manquants"}), 400
+
+    user = User.query.filter_by(email=data["email"]).first()
+    if user and user.check_password(data["password"]):
+        token = create_access_token(identity=user.id)
+        return jsonify({
+            "token": token,
+            "user": {
+                "id": user.id, "username": user.username,
+                "email": user.email, "is_artist": user.is_artist, "bio": user.bio
+            }
+        }), 200
+
+    return jsonify({"error": "Email ou mot de passe incorrect"}), 401
+
+
+@bp.route("/api/me", methods=["GET"])
+@jwt_required()
+def get_current_user():
+    user_id = get_jwt_identity()
+    user = User.query.get(user_id)
+    if not user:
+        return jsonify({"error": "Utilisateur non trouvé"}), 404
+    return jsonify({
+        "id": user.id, "username": user.username,
+        "email": user.email, "is_artist": user.is_artist, "bio": user.bio
+    }), 200
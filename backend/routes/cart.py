@@ -0,0 +1,103 @@
+from flask import Blueprint, request, jsonify
+from flask_jwt_extended import jwt_required, get_jwt_identity
+
+from extensions import db, limiter
+from idempotency import idempotent
+from models import Artwork, Cart
+from pricing import format_cents
+
+bp = Blueprint('cart', __name__)
+
+
+def _cart_totals(user_id):
+    """Total du panier calculé en SQL sur les centimes : [(devise, nb, total_cents)]."""
+    return (
+        db.session.query(
+            Artwork.currency,
+            db.func.count(Cart.id),
+            # SUM(bigint) renvoie un numeric sous Postgres : on reste en entier
+            db.cast(db.func.sum(Artwork.price_cents), db.BigInteger),
+        )
+        .join(Cart, Cart.artwork_id == Artwork.id)
+        .filter(Cart.user_id == user_id)
+        .group_by(Artwork.currency)
+        .all()
+    )
+
+
+# ============================================================
+# 🛒 PANIER & CHECKOUT
+# ============================================================
+
+@bp.route("/api/cart", methods=["GET"])
+@jwt_required()
+def get_cart():
+    user_id = get_jwt_identity()
+    items = Cart.query.filter_by(user_id=user_id).all()
+    return jsonify([{
+        "id": c.id, "title": c.artwork.title, "price": format_cents(c.artwork.price_cents),
+        "price_cents": c.artwork.price_cents, "currency": c.artwork.currency, "image_url": c.artwork.image_url
+    } for c in items]), 200
+
+
+@bp.route("/api/cart/summary", methods=["GET"])
+@jwt_required()
+def get_cart_summary():
+    totals = _cart_totals(get_jwt_identity())
+    return jsonify([{
+        "currency": currency, "count": count,
+        "total": format_cents(total), "total_cents": total
+    } for currency, count, total in totals]), 200
+
+
+@bp.route("/api/cart", methods=["POST"])
+@limiter.limit("30/minute")
+@jwt_required()
+@idempotent
+def add_to_cart():
+    user_id = get_jwt_identity()
+    data = request.get_json()
+    artwork_id = data.get("artwork_id")
+    if Cart.query.filter_by(user_id=user_id, artwork_id=artwork_id).first():
+        return jsonify({"error": "Déjà dans le panier"}), 400
+    db.session.add(Cart(user_id=user_id, artwork_id=artwork_id))
+    db.session.commit()
+    return jsonify({"message": "Ajoutée au panier"}), 201
+
+
+@bp.route("/api/cart/<int:item_id>", methods=["DELETE"])
+@limiter.limit("30/minute")
+@jwt_required()
+def remove_from_cart(item_id):
+    user_id = get_jwt_identity()
+    item = Cart.query.filter_by(id=item_id, user_id=user_id).first()
+    if not item:
+        return jsonify({"error": "Article introuvable"}), 404
+    db.session.delete(item)
+    db.session.commit()
+    return jsonify({"message": "Article retiré du panier"}), 200
+
+
+@bp.route("/api/cart/checkout", methods=["POST"])
+@limiter.limit("5/minute")
+@jwt_required()
+@idempotent
+def checkout():
+    user_id = get_jwt_identity()
+    totals = _cart_totals(user_id)
+    if not totals:
+        return jsonify({"error": "Panier vide"}), 400
+    if len(totals) > 1:
+        return jsonify({"error": "Le panier contient des œuvres dans plusieurs devises"}), 400
+    currency, _, total = totals[0]
+
+    cart_artworks = db.select(Cart.artwork_id).filter(Cart.user_id == user_id)
+    Artwork.query.filter(Artwork.id.in_(cart_artworks)).update(
+        {Artwork.is_sold: True}, synchronize_session=False
+    )
+    Cart.query.filter_by(user_id=user_id).delete(synchronize_session=False)
+    db.session.commit()
+    return jsonify({
+        "message": "Paiement réussi 🎉", "total": format_cents(total),
+        "total_cents": total, "currency": currency
+    }), 200
@@ -0,0 +1,15 @@
+from flask import Blueprint, jsonify
+
+from models import Category
+
+bp = Blueprint('categories', __name__)
+
+
+# ============================================================
+# 📊 CATÉGORIES
+# ============================================================
+
+@bp.route("/api/categories", methods=["GET"])
+def get_categories():
+    categories = Category.query.all()
+    return jsonify([{"id": c.id, "name": c.name} for c in categories]), 200
@@ -0,0 +1,108 @@
+from flask import Blueprint, request, jsonify
+from flask_jwt_extended import jwt_required, get_jwt_identity
+from sqlalchemy.exc import IntegrityError
+
+from extensions import db, limiter
+from idempotency import idempotent
+from models import Artwork, Comment, Like
+
+bp = Blueprint('social', __name__)
+
+
+# ============================================================
+# ❤️ LIKE & 💬 COMMENTAIRES
+# ============================================================
+
+@bp.route("/api/artworks/<int:artwork_id>/like", methods=["POST"])
+@limiter.limit("30/minute")
+@jwt_required()
+@idempotent
+def toggle_like(artwork_id):
+    user_id = get_jwt_identity()
+    artwork = Artwork.query.get_or_404(artwork_id)
+    existing_like = Like.query.filter_by(user_id=user_id, artwork_id=artwork_id).first()
+
+    if existing_like:
+        db.session.delete(existing_like)
+        db.session.commit()
+        return jsonify({"liked": False, "message": "Like retiré"}), 200
+
+    new_like = Like(user_id=user_id, artwork_id=artwork_id)
+    db.session.add(new_like)
+    try:
+        db.session.commit()
+    except IntegrityError:
+        # Un autre appel concurrent vient d'ajouter le même like
+        db.session.rollback()
+        return jsonify({"liked": True, "message": "Déjà aimée"}), 200
+    return jsonify({"liked": True, "message": "Like ajouté"}), 201
+
+
+# Variantes idempotentes du toggle : rejouer la requête ne change rien
+@bp.route("/api/artworks/<int:artwork_id>/like", methods=["PUT"])
+@limiter.limit("30/minute")
+@jwt_required()
+def like_artwork(artwork_id):
+    user_id = get_jwt_identity()
+    if Like.query.filter_by(user_id=user_id, artwork_id=artwork_id).first():
+        return jsonify({"liked": True, "message": "Déjà aimée"}), 200
+
+    Artwork.query.get_or_404(artwork_id)
+    db.session.add(Like(user_id=user_id, artwork_id=artwork_id))
+    try:
+        db.session.commit()
+    except IntegrityError:
+        # PUT concurrent : la contrainte uq_like_user_artwork a déjà été satisfaite
+        db.session.rollback()
+        return jsonify({"liked": True, "message": "Déjà aimée"}), 200
+    return jsonify({"liked": True, "message": "Like ajouté"}), 201
+
+
+@bp.route("/api/artworks/<int:artwork_id>/like", methods=["DELETE"])
+@limiter.limit("30/minute")
+@jwt_required()
+def unlike_artwork(artwork_id):
+    user_id = get_jwt_identity()
+    deleted = Like.query.filter_by(user_id=user_id, artwork_id=artwork_id).delete()
+    if deleted:
+        db.session.commit()
+        return jsonify({"liked": False, "message": "Like retiré"}), 200
+
+    Artwork.query.get_or_404(artwork_id)
+    return jsonify({"liked": False, "message": "Pas de like à retirer"}), 200
+
+
+@bp.route("/api/artworks/<int:artwork_id>/comments", methods=["GET"])
+def get_comments(artwork_id):
+    artwork = Artwork.query.get_or_404(artwork_id)
+    comments = [{
+        "id": c.id,
+        "content": c.content,
+        "author": c.user.username,
+        "created_at": c.created_at.strftime("%Y-%m-%d %H:%M")
+    } for c in artwork.comments]
+    return jsonify(comments), 200
+
+
+@bp.route("/api/artworks/<int:artwork_id>/comments", methods=["POST"])
+@limiter.limit("10/minute")
+@jwt_required()
+def add_comment(artwork_id):
+    user_id = get_jwt_identity()
+    data = request.get_json()
+    content = data.get("content", "").strip()
+
+    if not content:
+        return jsonify({"error": "Commentaire vide"}), 400
+
+    artwork = Artwork.query.get_or_404(artwork_id)
+    comment = Comment(content=content, user_id=user_id, artwork_id=artwork.id)
+    db.session.add(comment)
+    db.session.commit()
+
+    return jsonify({
+        "id": comment.id,
+        "content": comment.content,
+        "author": comment.user.username,
+        "created_at": comment.created_at.strftime("%Y-%m-%d %H:%M")
+    }), 201
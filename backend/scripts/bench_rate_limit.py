@@ -0,0 +1,74 @@
+"""Mesure le surcoût du limiteur de débit par requête.
+
+Usage : python scripts/bench_rate_limit.py [--requests 5000] [--repeat 7] [--redis redis://localhost:6379/0]
+"""
+import argparse
+import os
+import statistics
+import sys
+import timeit
+
+from flask import Flask, jsonify
+from flask_jwt_extended import JWTManager
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rate_limit import MemoryStore, RateLimiter, create_store  # noqa: E402
+
+
+def build_app(storage_url, enabled):
+    app = Flask(__name__)
+    app.config["JWT_SECRET_KEY"] = "bench"
+    app.config["RATELIMIT_ENABLED"] = enabled
+    app.config["RATELIMIT_STORAGE_URL"] = storage_url
+    JWTManager(app)
+    limiter = RateLimiter(app)
+
+    @app.route("/limited")
+    @limiter.limit("1000000/minute")
+    def limited():
+        return jsonify({"ok": True})
+
+    return app
+
+
+def per_request_us(client, n):
+    return timeit.timeit(lambda: client.get("/limited"), number=n) / n * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--redis", default=None)
+    args = parser.parse_args()
+    n = args.requests
+
+    store = create_store(args.redis) if args.redis else MemoryStore()
+    hit_us = min(timeit.repeat(
+        lambda: store.hit("bench:ip:127.0.0.1", 10**9, 60), number=n, repeat=args.repeat
+    )) / n * 1e6
+    print(f"{type(store).__name__}.hit : {hit_us:.2f} µs/appel (min de {args.repeat})")
+
+    clients = {
+        "sans": build_app(args.redis, enabled=False).test_client(),
+        "avec": build_app(args.redis, enabled=True).test_client(),
+    }
+    samples = {name: [] for name in clients}
+    for client in clients.values():
+        client.get("/limited")
+    # Passes entrelacées pour que le bruit de la machine touche les deux configurations
+    for _ in range(args.repeat):
+        for name, client in clients.items():
+            samples[name].append(per_request_us(client, n))
+
+    baseline = statistics.median(samples["sans"])
+    limited = statistics.median(samples["avec"])
+    print(f"Requête sans limiteur : {baseline:.1f} µs (médiane, min {min(samples['sans']):.1f})")
+    print(f"Requête avec limiteur : {limited:.1f} µs (médiane, min {min(samples['avec']):.1f})")
+    print(f"Surcoût du limiteur   : {limited - baseline:.1f} µs/requête (médianes), "
+          f"{min(samples['avec']) - min(samples['sans']):.1f} µs (minima)")
+
+
+if __name__ == "__main__":
+    main()
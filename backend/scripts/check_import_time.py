@@ -0,0 +1,82 @@
+"""Mesure le démarrage à froid : imports (`python -X importtime`) + create_app().
+
+Échoue si ce total dépasse le budget ou si un module lourd
+(cloudinary, stripe, numpy, scipy) est importé au démarrage.
+
+Usage : python scripts/check_import_time.py [--budget-ms 1500] [--top 15]
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# SDK qui ne doivent être importés qu'à la demande
+LAZY_MODULES = ("cloudinary", "stripe", "numpy", "scipy")
+
+# Affiche sur stdout la durée de create_app() en secondes ; les imports sont
+# mesurés séparément par -X importtime sur stderr
+STARTUP = (
+    "import time; from app import create_app; "
+    "start = time.perf_counter(); create_app(); print(time.perf_counter() - start)"
+)
+
+
+def run_importtime():
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", STARTUP],
+        cwd=BACKEND_DIR, capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        sys.stderr.write(result.stderr)
+        sys.exit(result.returncode)
+    return result.stderr, float(result.stdout.strip().splitlines()[-1])
+
+
+def parse(stderr):
+    """Retourne [(module, self_us, cumulative_us)] en ignorant l'en-tête."""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        # Le nom est précédé d'un espace puis de deux espaces par niveau
+        rows.append((name[1:].rstrip(), int(self_us), int(cumulative_us)))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--budget-ms", type=float, default=1500)
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+
+    stderr, create_app_s = run_importtime()
+    rows = parse(stderr)
+    # Les modules de premier niveau (non indentés) portent le temps cumulé
+    import_us = sum(cum for name, _, cum in rows if not name.startswith(" "))
+    total_us = import_us + create_app_s * 1e6
+
+    print(f"Imports      : {import_us / 1000:.1f} ms")
+    print(f"create_app() : {create_app_s * 1000:.1f} ms")
+    print(f"Démarrage    : {total_us / 1000:.1f} ms (budget {args.budget_ms:.0f} ms)")
+    print("Modules les plus coûteux (cumulé) :")
+    for name, _, cum in sorted(rows, key=lambda r: r[2], reverse=True)[:args.top]:
+        print(f"  {cum / 1000:8.1f} ms  {name.strip()}")
+
+    errors = []
+    imported = {name.strip().split(".")[0] for name, _, _ in rows}
+    for module in LAZY_MODULES:
+        if module in imported:
+            errors.append(f"{module} est importé au démarrage")
+    if total_us / 1000 > args.budget_ms:
+        errors.append("budget de démarrage dépassé")
+
+    for error in errors:
+        print(f"❌ {error}")
+    sys.exit(1 if errors else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+import os
+import sys
+
+import pytest
+from flask_jwt_extended import create_access_token
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import create_app  # noqa: E402
+from extensions import db  # noqa: E402
+from models import Artwork, User  # noqa: E402
+
+
+TEST_CONFIG = {
+    "TESTING": True,
+    "SQLALCHEMY_DATABASE_URI": "sqlite://",
+    "RATELIMIT_ENABLED": False,
+    "PROXY_FIX_X_FOR": 0,
+}
+
+
+@pytest.fixture
+def make_app():
+    def factory(**overrides):
+        app = create_app({**TEST_CONFIG, **overrides})
+        with app.app_context():
+            db.create_all()
+        return app
+    return factory
+
+
+@pytest.fixture
+def app(make_app):
+    return make_app()
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+@pytest.fixture
+def artist(app):
+    with app.app_context():
+        user = User(username="artiste", email="artiste@test.com", is_artist=True)
+        user.set_password("secret")
+        db.session.add(user)
+        db.session.commit()
+        return user.id
+
+
+@pytest.fixture
+def auth(app, artist):
+    with app.app_context():
+        return {"Authorization": f"Bearer {create_access_token(identity=artist)}"}
+
+
+@pytest.fixture
+def make_artwork(app, artist):
+    def factory(price_cents=1000, currency="USD", **fields):
+        with app.app_context():
+            artwork = Artwork(
+                title=fields.pop("title", "Œuvre"), price_cents=price_cents,
+                currency=currency, artist_id=artist, **fields
+            )
+            db.session.add(artwork)
+            db.session.commit()
+            return artwork.id
+    return factory
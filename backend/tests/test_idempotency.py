@@ -0,0 +1,125 @@
+from datetime import datetime, timedelta
+
+from extensions import db
+from models import Artwork, IdempotencyKey, Like
+
+
+def with_key(auth, key):
+    return {**auth, "Idempotency-Key": key}
+
+
+def test_retry_replays_first_response(app, client, auth):
+    headers = with_key(auth, "k1")
+    first = client.post("/api/artworks", json={"title": "t", "price": "12.50"}, headers=headers)
+    retry = client.post("/api/artworks", json={"title": "t", "price": "12.50"}, headers=headers)
+
+    assert first.status_code == retry.status_code == 201
+    assert retry.get_json() == first.get_json()
+    assert "Idempotent-Replayed" not in first.headers
+    assert retry.headers["Idempotent-Replayed"] == "true"
+    with app.app_context():
+        assert Artwork.query.count() == 1
+
+
+def test_without_key_every_call_runs(app, client, auth):
+    for _ in range(2):
+        client.post("/api/artworks", json={"title": "t", "price": "1"}, headers=auth)
+    with app.app_context():
+        assert Artwork.query.count() == 2
+
+
+def test_key_reused_on_other_route_is_rejected(client, auth, make_artwork):
+    artwork_id = make_artwork()
+    client.post("/api/artworks", json={"title": "t", "price": "1"}, headers=with_key(auth, "k"))
+    response = client.post("/api/cart", json={"artwork_id": artwork_id}, headers=with_key(auth, "k"))
+    assert response.status_code == 422
+
+
+def test_key_reused_with_other_body_is_rejected(app, client, auth):
+    headers = with_key(auth, "k")
+    client.post("/api/artworks", json={"title": "t", "price": "1"}, headers=headers)
+    response = client.post("/api/artworks", json={"title": "t", "price": "2"}, headers=headers)
+    assert response.status_code == 422
+    with app.app_context():
+        assert Artwork.query.count() == 1
+
+
+def reserve(app, artist, body, age):
+    import hashlib
+
+    with app.app_context():
+        db.session.add(IdempotencyKey(
+            key="k", user_id=artist, method="POST", path="/api/artworks",
+            request_hash=hashlib.sha256(body).hexdigest(),
+            created_at=datetime.utcnow() - age,
+        ))
+        db.session.commit()
+
+
+def test_in_flight_reservation_returns_409(app, client, auth, artist):
+    body = b'{"title": "t", "price": "1"}'
+    reserve(app, artist, body, age=timedelta(seconds=1))
+    response = client.post(
+        "/api/artworks", data=body, content_type="application/json", headers=with_key(auth, "k")
+    )
+    assert response.status_code == 409
+
+
+def test_abandoned_reservation_is_taken_over(app, client, auth, artist):
+    body = b'{"title": "t", "price": "1"}'
+    reserve(app, artist, body, age=timedelta(minutes=5))
+    response = client.post(
+        "/api/artworks", data=body, content_type="application/json", headers=with_key(auth, "k")
+    )
+    assert response.status_code == 201
+    with app.app_context():
+        assert IdempotencyKey.query.one().status_code == 201
+
+
+def test_failed_attempt_releases_key(app, client, auth):
+    response = client.post("/api/artworks/999/like", headers=with_key(auth, "k"))
+    assert response.status_code == 404
+    with app.app_context():
+        assert IdempotencyKey.query.count() == 0
+
+
+def test_retried_toggle_does_not_flip_back(app, client, auth, make_artwork):
+    artwork_id = make_artwork()
+    headers = with_key(auth, "like")
+    for _ in range(3):
+        response = client.post(f"/api/artworks/{artwork_id}/like", headers=headers)
+        assert response.get_json()["liked"] is True
+    with app.app_context():
+        assert Like.query.count() == 1
+
+
+def test_purge_expired_keys(app, artist):
+    from idempotency import purge_expired_keys
+
+    with app.app_context():
+        for key, age in (("old", timedelta(days=2)), ("new", timedelta(minutes=1))):
+            db.session.add(IdempotencyKey(
+                key=key, user_id=artist, method="POST", path="/", request_hash="",
+                status_code=200, created_at=datetime.utcnow() - age,
+            ))
+        db.session.commit()
+        assert purge_expired_keys() == 1
+        assert [k.key for k in IdempotencyKey.query.all()] == ["new"]
+
+
+def test_put_and_delete_like_are_idempotent(app, client, auth, make_artwork):
+    artwork_id = make_artwork()
+    url = f"/api/artworks/{artwork_id}/like"
+
+    assert client.put(url, headers=auth).status_code == 201
+    assert client.put(url, headers=auth).status_code == 200
+    with app.app_context():
+        assert Like.query.count() == 1
+
+    assert client.delete(url, headers=auth).get_json()["liked"] is False
+    assert client.delete(url, headers=auth).status_code == 200
+    with app.app_context():
+        assert Like.query.count() == 0
+
+    assert client.put("/api/artworks/999/like", headers=auth).status_code == 404
+    assert client.delete("/api/artworks/999/like", headers=auth).status_code == 404
@@ -0,0 +1,88 @@
+import pytest
+
+from pricing import format_cents, parse_currency, parse_price_cents
+
+
+@pytest.mark.parametrize("value, cents", [
+    ("12.50", 1250),
+    ("12,5", 1250),
+    (12.5, 1250),
+    (7, 700),
+    ("0", 0),
+    ("1.005", 101),
+    ("2.675", 268),
+    ("0.1", 10),
+])
+def test_parse_price_cents(value, cents):
+    assert parse_price_cents(value) == cents
+
+
+@pytest.mark.parametrize("value", [
+    "abc", "", "-1", "NaN", "Infinity", None, "99999999999999999", "1e20",
+])
+def test_parse_price_cents_rejects_invalid(value):
+    with pytest.raises(ValueError):
+        parse_price_cents(value)
+
+
+@pytest.mark.parametrize("value", ["0", 0, "-0", "0.001"])
+def test_parse_price_cents_minimum(value):
+    assert parse_price_cents(value) == 0
+    with pytest.raises(ValueError):
+        parse_price_cents(value, minimum=1)
+
+
+@pytest.mark.parametrize("price", ["0", 0, "-0", "0.001", "1e20", "99999999999999999"])
+def test_create_artwork_rejects_out_of_range_price(client, auth, price):
+    response = client.post("/api/artworks", json={"title": "t", "price": price}, headers=auth)
+    assert response.status_code == 400
+
+
+def test_format_cents():
+    assert format_cents(1999) == "19.99"
+    assert format_cents(700) == "7.00"
+    assert format_cents(None) is None
+
+
+def test_parse_currency():
+    assert parse_currency(" htg ") == "HTG"
+    with pytest.raises(ValueError):
+        parse_currency("US")
+
+
+def test_api_serves_decimal_strings(client, auth):
+    client.post("/api/artworks", json={"title": "t", "price": "19.99"}, headers=auth)
+    artwork = client.get("/api/artworks").get_json()[0]
+    assert artwork["price"] == "19.99"
+    assert artwork["price_cents"] == 1999
+    assert artwork["currency"] == "USD"
+
+
+def test_price_filters_and_sort(client, make_artwork):
+    for cents in (500, 1500, 2500):
+        make_artwork(price_cents=cents)
+    artworks = client.get("/api/artworks?min_price=10&max_price=30&sort=price_desc").get_json()
+    assert [a["price_cents"] for a in artworks] == [2500, 1500]
+    assert client.get("/api/artworks?min_price=abc").status_code == 400
+    assert client.get("/api/artworks?min_price=1e20").status_code == 400
+    assert client.get("/api/artworks?min_price=0").status_code == 200
+
+
+def test_cart_totals_and_checkout_in_cents(app, client, auth, make_artwork):
+    for cents in (1999, 1):
+        client.post("/api/cart", json={"artwork_id": make_artwork(price_cents=cents)}, headers=auth)
+
+    summary = client.get("/api/cart/summary", headers=auth).get_json()
+    assert summary == [{"currency": "USD", "count": 2, "total": "20.00", "total_cents": 2000}]
+
+    response = client.post("/api/cart/checkout", headers=auth)
+    assert response.status_code == 200
+    assert response.get_json()["total_cents"] == 2000
+    assert client.get("/api/cart", headers=auth).get_json() == []
+    assert all(a["is_sold"] for a in client.get("/api/artworks").get_json())
+
+
+def test_checkout_rejects_mixed_currencies(client, auth, make_artwork):
+    for currency in ("USD", "HTG"):
+        client.post("/api/cart", json={"artwork_id": make_artwork(currency=currency)}, headers=auth)
+    assert client.post("/api/cart/checkout", headers=auth).status_code == 400
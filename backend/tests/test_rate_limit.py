@@ -0,0 +1,62 @@
+import pytest
+
+
+@pytest.fixture
+def limited_client(make_app):
+    return make_app(RATELIMIT_ENABLED=True, PROXY_FIX_X_FOR=1).test_client()
+
+
+def test_budget_exhaustion_returns_429_with_retry_after(limited_client):
+    statuses = [limited_client.post("/api/register", json={}).status_code for _ in range(6)]
+    assert statuses == [400] * 5 + [429]
+
+    response = limited_client.post("/api/register", json={})
+    assert 1 <= int(response.headers["Retry-After"]) <= 60
+    assert response.headers["X-RateLimit-Remaining"] == "0"
+
+
+def test_forwarded_clients_get_their_own_bucket(limited_client):
+    for ip in ("203.0.113.1", "203.0.113.2"):
+        statuses = [
+            limited_client.post("/api/register", json={}, headers={"X-Forwarded-For": ip}).status_code
+            for _ in range(5)
+        ]
+        assert 429 not in statuses
+
+
+def test_forwarded_header_ignored_without_trusted_proxy(make_app):
+    client = make_app(RATELIMIT_ENABLED=True).test_client()
+    statuses = [
+        client.post("/api/register", json={}, headers={"X-Forwarded-For": f"203.0.113.{i}"}).status_code
+        for i in range(6)
+    ]
+    assert statuses[-1] == 429
+
+
+def test_write_routes_declare_budgets(app):
+    for endpoint in (
+        "artworks.create_artwork", "artworks.update_artwork", "artworks.delete_artwork",
+        "cart.add_to_cart", "cart.remove_from_cart", "cart.checkout",
+    ):
+        assert hasattr(app.view_functions[endpoint], "_rate_limit"), endpoint
+
+
+def test_cors_preflight_is_not_counted(limited_client):
+    response = limited_client.options("/api/artworks/1/like")
+    assert "X-RateLimit-Remaining" not in response.headers
+
+
+def test_memory_store_sliding_window(monkeypatch):
+    import rate_limit
+
+    now = [1000.0]
+    monkeypatch.setattr(rate_limit.time, "monotonic", lambda: now[0])
+    store = rate_limit.MemoryStore()
+
+    assert store.hit("k", 2, 60)[0]
+    assert store.hit("k", 2, 60)[0]
+    allowed, remaining, retry_after = store.hit("k", 2, 60)
+    assert (allowed, remaining, retry_after) == (False, 0, 60)
+
+    now[0] += 60
+    assert store.hit("k", 2, 60)[0]
@@ -0,0 +1,82 @@
+from extensions import db
+from models import Like, RelatedArtwork, User, artwork_categories
+
+
+def test_build_related_index_ranks_co_liked_artworks(app, client, make_artwork):
+    a, b, c, d = (make_artwork(title=t) for t in "abcd")
+    with app.app_context():
+        users = [User(username=f"u{i}", email=f"u{i}@test.com") for i in range(3)]
+        db.session.add_all(users)
+        db.session.commit()
+        # a et b sont aimées ensemble par tous, c une seule fois avec a, d jamais
+        likes = [(0, a), (0, b), (1, a), (1, b), (2, a), (2, b), (2, c)]
+        db.session.add_all(Like(user_id=users[u].id, artwork_id=art) for u, art in likes)
+        db.session.commit()
+
+        from recommendations import build_related_index
+
+        assert build_related_index(top_k=5) > 0
+        assert RelatedArtwork.query.filter_by(artwork_id=d).count() == 0
+
+    related = client.get(f"/api/artworks/{a}/related").get_json()
+    assert [r["id"] for r in related] == [b, c]
+    assert client.get(f"/api/artworks/{a}/related?limit=-1").get_json()[0]["id"] == b
+    assert client.get(f"/api/artworks/{d}/related").get_json() == []
+    assert client.get("/api/artworks/999/related").status_code == 404
+
+
+def test_artworks_without_likes_fall_back_to_their_categories(app, client, make_artwork):
+    from models import Category
+
+    with app.app_context():
+        painting, sculpture = Category(name="Peinture"), Category(name="Sculpture")
+        db.session.add_all([painting, sculpture])
+        db.session.commit()
+        painting_id, sculpture_id = painting.id, sculpture.id
+
+    def categorised(category_id):
+        artwork_id = make_artwork()
+        with app.app_context():
+            db.session.execute(artwork_categories.insert().values(
+                artwork_id=artwork_id, category_id=category_id
+            ))
+            db.session.commit()
+        return artwork_id
+
+    paintings = [categorised(painting_id) for _ in range(5)]
+    alone = categorised(sculpture_id)
+
+    with app.app_context():
+        from recommendations import build_related_index
+
+        assert build_related_index(top_k=3) == 5 * 3
+
+    related = client.get(f"/api/artworks/{paintings[0]}/related").get_json()
+    assert len(related) == 3
+    assert {r["id"] for r in related} <= set(paintings[1:])
+    assert client.get(f"/api/artworks/{alone}/related").get_json() == []
+
+
+def test_category_fallback_comes_after_co_liked_neighbours(app, client, make_artwork):
+    from models import Category
+
+    a, b, c = (make_artwork(title=t) for t in "abc")
+    with app.app_context():
+        category = Category(name="Portrait")
+        db.session.add(category)
+        db.session.commit()
+        for artwork_id in (a, c):
+            db.session.execute(artwork_categories.insert().values(
+                artwork_id=artwork_id, category_id=category.id
+            ))
+        user = User(username="u", email="u@test.com")
+        db.session.add(user)
+        db.session.commit()
+        db.session.add_all([Like(user_id=user.id, artwork_id=a), Like(user_id=user.id, artwork_id=b)])
+        db.session.commit()
+
+        from recommendations import build_related_index
+
+        build_related_index(top_k=5)
+
+    assert [r["id"] for r in client.get(f"/api/artworks/{a}/related").get_json()] == [b, c]
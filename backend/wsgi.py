@@ -0,0 +1,4 @@
+from app import create_app
+
+# Point d'entrée gunicorn : gunicorn wsgi:app (app:app reste accepté)
+app = create_app()
@@ -12,7 +12,8 @@ function CartPage() {
     if (user) fetchCart();
   }, [user]);
 
-  const totalPrice = cart.reduce((sum, item) => sum + item.price, 0);
+  // Somme en centimes entiers : le prix est servi en chaîne décimale
+  const totalPrice = cart.reduce((sum, item) => sum + item.price_cents, 0) / 100;
 
   
   if (!user) {
@@ -60,7 +61,7 @@ function CartPage() {
                 <div style={infoStyle}>
                   <h3>{item.title}</h3>
                   <p>
-                    <strong>Prix :</strong> ${item.price.toFixed(2)}
+                    <strong>Prix :</strong> ${item.price}
                   </p>
                   <button
                     onClick={() => removeFromCart(item.id)}
@@ -14,7 +14,8 @@ function PaymentPage() {
   const [success, setSuccess] = useState(false);
   const [error, setError] = useState("");
 
-  const total = cart.reduce((sum, item) => sum + item.price, 0);
+  // Somme en centimes entiers : le prix est servi en chaîne décimale
+  const total = cart.reduce((sum, item) => sum + item.price_cents, 0) / 100;
 
   const handleSubmit = async (e) => {
     e.preventDefault();